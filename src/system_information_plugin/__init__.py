@@ -1,35 +1,41 @@
 """This is a system information plugin for Auto-GPT."""
+from __future__ import annotations
+
+__all__ = ["Message", "SystemInformationPlugin"]
+
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict, TypeVar
+from typing import Any, Dict, Optional
 
-from auto_gpt_plugin_template import AutoGPTPluginTemplate
+from auto_gpt_plugin_template import AutoGPTPluginTemplate, Message, PromptGenerator
 from dotenv import load_dotenv
 
 from .system_information import get_shell_name, get_system_information
 
-PromptGenerator = TypeVar("PromptGenerator")
-
 with open(str(Path(os.getcwd()) / ".env"), "r", encoding="utf-8") as fp:
     load_dotenv(stream=fp)
 
 
-class Message(TypedDict):
-    role: str
-    content: str
-
-
 class SystemInformationPlugin(AutoGPTPluginTemplate):
     """
     This is a system information plugin for Auto-GPT which
     adds the system information to the prompt.
     """
 
+    __slots__ = (
+        "_name",
+        "_version",
+        "_description",
+        "_resource_str",
+        "execute_local_commands",
+    )
+
     def __init__(self):
         super().__init__()
         self._name = "Auto-GPT-Plugin-SystemInfo"
         self._version = "0.1.2"
         self._description = "This is system info plugin for Auto-GPT."
+        self._resource_str: Optional[str] = None
 
         self.execute_local_commands = (
             os.getenv("EXECUTE_LOCAL_COMMANDS", "False") == "True"
@@ -42,6 +48,11 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
                 "System information will not be added to the context.",
             )
 
+    @staticmethod
+    def _noop(*_args, **_kwargs) -> None:
+        """Shared body of the hooks this plugin does not handle."""
+        return None
+
     def post_prompt(self, prompt: PromptGenerator) -> PromptGenerator:
         """This method is called just after the generate_prompt is called,
         but actually before the prompt is generated.
@@ -52,18 +63,24 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
         """
 
         if self.execute_local_commands:
-            os_info = get_system_information()
-            shell_info = get_shell_name()
-
-            # Add the shell information to the prompt if it is not empty
-            if shell_info != "":
-                shell_info = f" in {shell_info}"
-
-            if os_info:
-                prompt.add_resource(
-                    f"Shell commands executed on {os_info}{shell_info}",
+            # Build the resource on the first prompt only, "" means nothing to add
+            if self._resource_str is None:
+                os_info = get_system_information()
+                shell_info = get_shell_name()
+
+                # Add the shell information to the prompt if it is not empty
+                if shell_info != "":
+                    shell_info = f" in {shell_info}"
+
+                self._resource_str = (
+                    f"Shell commands executed on {os_info}{shell_info}"
+                    if os_info
+                    else ""
                 )
 
+            if self._resource_str:
+                prompt.add_resource(self._resource_str)
+
         return prompt
 
     def can_handle_post_prompt(self) -> bool:
@@ -80,9 +97,7 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
             bool: True if the plugin can handle the on_response method."""
         return False
 
-    def on_response(self, response: str, *args, **kwargs) -> str:
-        """This method is called when a response is received from the model."""
-        pass
+    on_response = _noop
 
     def can_handle_on_planning(self) -> bool:
         """This method is called to check that the plugin can
@@ -91,15 +106,7 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
             bool: True if the plugin can handle the on_planning method."""
         return False
 
-    def on_planning(
-        self, prompt: PromptGenerator, messages: List[Message]
-    ) -> Optional[str]:
-        """This method is called before the planning chat completion is done.
-        Args:
-            prompt (PromptGenerator): The prompt generator.
-            messages (List[str]): The list of messages.
-        """
-        pass
+    on_planning = _noop
 
     def can_handle_post_planning(self) -> bool:
         """This method is called to check that the plugin can
@@ -108,14 +115,7 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
             bool: True if the plugin can handle the post_planning method."""
         return False
 
-    def post_planning(self, response: str) -> str:
-        """This method is called after the planning chat completion is done.
-        Args:
-            response (str): The response.
-        Returns:
-            str: The resulting response.
-        """
-        pass
+    post_planning = _noop
 
     def can_handle_pre_instruction(self) -> bool:
         """This method is called to check that the plugin can
@@ -124,14 +124,7 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
             bool: True if the plugin can handle the pre_instruction method."""
         return False
 
-    def pre_instruction(self, messages: List[Message]) -> List[Message]:
-        """This method is called before the instruction chat is done.
-        Args:
-            messages (List[Message]): The list of context messages.
-        Returns:
-            List[Message]: The resulting list of messages.
-        """
-        pass
+    pre_instruction = _noop
 
     def can_handle_on_instruction(self) -> bool:
         """This method is called to check that the plugin can
@@ -140,14 +133,7 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
             bool: True if the plugin can handle the on_instruction method."""
         return False
 
-    def on_instruction(self, messages: List[Message]) -> Optional[str]:
-        """This method is called when the instruction chat is done.
-        Args:
-            messages (List[Message]): The list of context messages.
-        Returns:
-            Optional[str]: The resulting message.
-        """
-        pass
+    on_instruction = _noop
 
     def can_handle_post_instruction(self) -> bool:
         """This method is called to check that the plugin can
@@ -156,14 +142,7 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
             bool: True if the plugin can handle the post_instruction method."""
         return False
 
-    def post_instruction(self, response: str) -> str:
-        """This method is called after the instruction chat is done.
-        Args:
-            response (str): The response.
-        Returns:
-            str: The resulting response.
-        """
-        pass
+    post_instruction = _noop
 
     def can_handle_pre_command(self) -> bool:
         """This method is called to check that the plugin can
@@ -172,17 +151,7 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
             bool: True if the plugin can handle the pre_command method."""
         return False
 
-    def pre_command(
-        self, command_name: str, arguments: Dict[str, Any]
-    ) -> Tuple[str, Dict[str, Any]]:
-        """This method is called before the command is executed.
-        Args:
-            command_name (str): The command name.
-            arguments (Dict[str, Any]): The arguments.
-        Returns:
-            Tuple[str, Dict[str, Any]]: The command name and the arguments.
-        """
-        pass
+    pre_command = _noop
 
     def can_handle_post_command(self) -> bool:
         """This method is called to check that the plugin can
@@ -191,15 +160,7 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
             bool: True if the plugin can handle the post_command method."""
         return False
 
-    def post_command(self, command_name: str, response: str) -> str:
-        """This method is called after the command is executed.
-        Args:
-            command_name (str): The command name.
-            response (str): The response.
-        Returns:
-            str: The resulting response.
-        """
-        pass
+    post_command = _noop
 
     def can_handle_chat_completion(
         self, messages: Dict[Any, Any], model: str, temperature: float, max_tokens: int
@@ -215,29 +176,14 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
               bool: True if the plugin can handle the chat_completion method."""
         return False
 
-    def handle_chat_completion(
-        self, messages: List[Message], model: str, temperature: float, max_tokens: int
-    ) -> str:
-        """This method is called when the chat completion is done.
-        Args:
-            messages (List[Message]): The messages.
-            model (str): The model name.
-            temperature (float): The temperature.
-            max_tokens (int): The max tokens.
-        Returns:
-            str: The resulting response.
-        """
-        pass
-        
+    handle_chat_completion = _noop
+
     def can_handle_text_embedding(
         self, text: str
     ) -> bool:
         return False
 
-    def handle_text_embedding(
-        self, text: str
-    ) -> list:
-        pass
+    handle_text_embedding = _noop
 
     def can_handle_user_input(self, user_input: str) -> bool:
         return False
@@ -248,6 +194,4 @@ class SystemInformationPlugin(AutoGPTPluginTemplate):
     def can_handle_report(self) -> bool:
         return False
 
-    def report(self, message: str) -> None:
-        pass
-
+    report = _noop
@@ -3,54 +3,105 @@ from __future__ import annotations
 
 import os
 import platform
+import struct
+import sys
 
-import distro
 
-
-def get_system_information() -> str:
+def _read_os_release() -> dict[str, str]:
     """
-    Gets system information.
+    Reads the KEY=VALUE pairs of the os-release file.
 
     Returns:
-        str: The system information.
+        dict[str, str]: The os-release fields, with quotes stripped.
+
+    Throws:
+        OSError: If the os-release file cannot be read.
     """
 
-    # Get system architecture
-    arch = platform.architecture()[0]
+    try:
+        # Python 3.10+ ships a parser that also checks /usr/lib/os-release
+        freedesktop_os_release = platform.freedesktop_os_release
+    except AttributeError:
+        pass
+    else:
+        return freedesktop_os_release()
 
-    # Get system distribution (works on Linux only)
-    if platform.system() == "Linux":
-        distro_name = distro.name()
-        distro_version = distro.version()
-        distro_id = distro.id()
+    with open("/etc/os-release", "r", encoding="utf-8") as f:
+        pairs = (line.rstrip().split("=", 1) for line in f if "=" in line)
+        return {key: value.strip("\"'") for key, value in pairs}
 
-        distro_info = f"{distro_name} {distro_version} ({distro_id})"
-    else:
-        distro_info = None
 
-    # Get Windows version (works on Windows only)
-    if platform.system() == "Windows":
-        win_ver = platform.win32_ver()
-        win_version = f"{win_ver[0]} {win_ver[1]} {win_ver[3]}"
-    else:
-        win_version = None
+def _compute_system_information() -> str:
+    """
+    Computes system information.
 
-    # Get macOS version (works on macOS only)
-    if platform.system() == "Darwin":
-        mac_ver = platform.mac_ver()
-        mac_version = f"{mac_ver[0]} {mac_ver[2]}"
+    Returns:
+        str: The system information.
+    """
+
+    sys_name = platform.system()
+
+    # Get system architecture from the pointer size, platform.architecture()
+    # would run file(1) on the interpreter binary to find the same thing
+    arch = f"{struct.calcsize('P') * 8}bit"
+
+    if sys_name == "Linux":
+        try:
+            os_release = _read_os_release()
+            distro_name = os_release.get("NAME", "")
+            distro_version = os_release.get("VERSION_ID", "")
+            distro_id = os_release.get("ID", "")
+        except OSError:
+            # No os-release, let distro probe the other release files
+            import distro  # pylint: disable=import-outside-toplevel
+
+            # Skip the lsb_release and uname subprocess fallbacks
+            linux_distro = distro.LinuxDistribution(
+                include_lsb=False, include_uname=False
+            )
+            # info() has the version and id in one call, but no name
+            distro_info = linux_distro.info()
+            distro_name = linux_distro.name()
+            distro_version = distro_info["version"]
+            distro_id = distro_info["id"]
+
+        parts = ["Linux", arch, distro_name, distro_version, f"({distro_id})"]
+    elif sys_name == "Windows":
+        # platform.win32_ver() may spawn "cmd /c ver", ask the API directly
+        win_ver = sys.getwindowsversion()  # pylint: disable=no-member
+        parts = ["Windows", f"{win_ver.major}.{win_ver.minor}", str(win_ver.build)]
+
+        win_edition = platform.win32_edition()
+        if win_edition:
+            parts.append(win_edition)
+    elif sys_name == "Darwin":
+        mac_release, _, mac_machine = platform.mac_ver()
+        if mac_release:
+            parts = ["macOS", mac_release, mac_machine]
+        else:
+            # SystemVersion.plist is unreadable, fall back to the kernel version
+            uname = os.uname()
+            parts = ["macOS", "Darwin", uname.release, uname.machine]
     else:
-        mac_version = None
+        # Unknown platform, report what the standard library knows about it
+        parts = [sys_name, arch]
 
     # Build the prompt
-    if distro_info:
-        os_info = f"Linux {arch} {distro_info}"
-    if win_version:
-        os_info = f"Windows {win_version}"
-    if mac_version:
-        os_info = f"macOS {mac_version}"
-
-    return os_info
+    return " ".join(parts)
+
+
+# The operating system cannot change while the process runs, so probe it once
+_OS_INFO = _compute_system_information()
+
+
+def get_system_information() -> str:
+    """
+    Gets system information.
+
+    Returns:
+        str: The system information.
+    """
+    return _OS_INFO
 
 
 def get_shell_name() -> str: